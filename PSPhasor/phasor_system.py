@@ -2,18 +2,24 @@
 
 from __future__ import annotations
 
+import cmath
 import csv
 import math
-from collections.abc import Iterator, Mapping, Sequence
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from contextlib import contextmanager
 from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Literal
 
-import matplotlib.pyplot as plt
-from matplotlib.axes import Axes
-from matplotlib.figure import Figure
-from matplotlib.lines import Line2D
-from matplotlib.patches import Arc
+if TYPE_CHECKING:
+    import numpy as np
+    from matplotlib.artist import Artist
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
+    from matplotlib.font_manager import FontProperties
+    from matplotlib.lines import Line2D
+    from numpy.typing import NDArray
 
 ReferencePoint = Literal["start", "end"]
 SequenceType = Literal["abc", "acb", "positive", "negative"]
@@ -26,6 +32,8 @@ DEFAULT_COLORS: dict[str, str] = {
 }
 THREE_PHASE_COLORS: tuple[str, str, str] = ("#1f77b4", "#d62728", "#2ca02c")
 PHASE_ROTATION = complex(-0.5, math.sqrt(3.0) / 2.0)
+_ORIGIN_EXTENTS = (0.0, 0.0, 0.0, 0.0)
+_START_KEYS = frozenset({"start_ref", "start_x", "start_y", "ref_point"})
 
 
 @dataclass(frozen=True)
@@ -54,7 +62,8 @@ class Phasor(Mapping[str, Any]):
 
     The class exposes typed attributes for new code and implements the mapping
     protocol so older dictionary-style reads such as ``phasor["magnitude"]``
-    continue to work.
+    continue to work. The complex value and its polar form are computed once
+    and cached, since the geometry of a frozen phasor never changes.
     """
 
     name: str
@@ -87,35 +96,37 @@ class Phasor(Mapping[str, Any]):
     def dx(self) -> float:
         """Return the phasor's real-axis component."""
 
-        return self.end_x - self.start_x
+        return self.value.real
 
     @property
     def dy(self) -> float:
         """Return the phasor's imaginary-axis component."""
 
-        return self.end_y - self.start_y
+        return self.value.imag
 
-    @property
+    @cached_property
     def value(self) -> complex:
         """Return the phasor value as a complex number."""
 
-        return complex(self.dx, self.dy)
+        return complex(self.end_x - self.start_x, self.end_y - self.start_y)
 
-    @property
+    @cached_property
     def magnitude(self) -> float:
         """Return the phasor magnitude."""
 
-        return abs(self.value)
+        return math.hypot(self.dx, self.dy)
 
-    @property
+    @cached_property
     def angle_deg(self) -> float:
         """Return the phasor angle in degrees."""
 
-        return math.degrees(math.atan2(self.dy, self.dx))
+        return math.degrees(cmath.phase(self.value))
 
     def as_dict(self) -> dict[str, Any]:
         """Return a dictionary representation of the phasor."""
 
+        dx, dy = self.dx, self.dy
+        angle_deg = self.angle_deg
         return {
             "name": self.name,
             "type": self.phasor_type,
@@ -124,12 +135,12 @@ class Phasor(Mapping[str, Any]):
             "start_y": self.start_y,
             "end_x": self.end_x,
             "end_y": self.end_y,
-            "dx": self.dx,
-            "dy": self.dy,
+            "dx": dx,
+            "dy": dy,
             "value": self.value,
             "magnitude": self.magnitude,
-            "angle": self.angle_deg,
-            "angle_deg": self.angle_deg,
+            "angle": angle_deg,
+            "angle_deg": angle_deg,
             "color": self.color,
             "label": self.label or self.name,
             "metadata": dict(self.metadata),
@@ -179,23 +190,51 @@ class PhasorManager:
         xlabel: str = "Real axis",
         ylabel: str = "Imaginary axis",
         style: DiagramStyle | None = None,
+        ax: Axes | None = None,
+        headless: bool = False,
     ) -> None:
         """Initialize a phasor diagram manager.
 
         Args:
-            figsize: Matplotlib figure size in inches.
+            figsize: Matplotlib figure size in inches. Ignored when ``ax`` is
+                given.
             title: Plot title.
             xlabel: Label for the horizontal axis.
             ylabel: Label for the vertical axis.
             style: Optional engineering plot style.
+            ax: Optional existing axes to draw on instead of creating a new
+                figure. The manager takes over styling and content of the axes.
+            headless: Render on a standalone Agg canvas instead of a pyplot
+                figure. Headless managers skip GUI backend setup and are not
+                retained by pyplot, which suits batch ``save`` and
+                ``to_array`` workflows. Ignored when ``ax`` is given.
         """
 
         self.fig: Figure
         self.ax: Axes
-        self.fig, self.ax = plt.subplots(figsize=figsize, constrained_layout=True)
+        self._external_axes = ax is not None
+        if ax is not None:
+            # ``ax.figure`` may be a subfigure; its ``figure`` is the root figure.
+            self.fig, self.ax = ax.figure.figure, ax
+        elif headless:
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            from matplotlib.figure import Figure
+
+            self.fig = Figure(figsize=figsize, constrained_layout=True)
+            FigureCanvasAgg(self.fig)
+            self.ax = self.fig.subplots()
+        else:
+            import matplotlib.pyplot as plt
+
+            self.fig, self.ax = plt.subplots(figsize=figsize, constrained_layout=True)
         self.phasors: dict[str, Phasor] = {}
         self._angle_annotations: list[AngleAnnotation] = []
         self._legend_location: str | None = None
+        self._render_depth = 0
+        self._render_pending = False
+        self._extents = _ORIGIN_EXTENTS
+        self._axis_lines: list[Line2D] = []
+        self._artists: list[Artist] = []
         self.title = title
         self.xlabel = xlabel
         self.ylabel = ylabel
@@ -206,30 +245,39 @@ class PhasorManager:
     def setup_plot(self) -> None:
         """Reset plot styling while preserving stored phasor data."""
 
+        self.ax.minorticks_on()
+        self._apply_grid(True)
+        self._remove_artists(self._axis_lines)
+        self._axis_lines = [
+            self.ax.axhline(y=0.0, zorder=1),
+            self.ax.axvline(x=0.0, zorder=1),
+        ]
+        self._apply_style()
+
+    def _apply_style(self) -> None:
+        """Apply the current title, labels, and style colors to the axes.
+
+        The grid is restyled but keeps its current visibility.
+        """
+
         self.ax.set_facecolor(self.style.background_color)
         self.ax.set_title(self.title)
         self.ax.set_xlabel(self.xlabel)
         self.ax.set_ylabel(self.ylabel)
-        self.ax.minorticks_on()
-        self._apply_grid(True)
-        self.ax.axhline(
-            y=0.0,
-            color=self.style.axis_color,
-            linewidth=self.style.axis_width,
-            zorder=1,
-        )
-        self.ax.axvline(
-            x=0.0,
-            color=self.style.axis_color,
-            linewidth=self.style.axis_width,
-            zorder=1,
-        )
+        for line in self._axis_lines:
+            line.set_color(self.style.axis_color)
+            line.set_linewidth(self.style.axis_width)
+        self._apply_grid(self._grid_shown())
 
     def _apply_grid(self, visible: bool) -> None:
         """Apply engineering grid styling."""
 
+        if not visible:
+            # Passing line properties to ``ax.grid`` would turn it back on.
+            self.ax.grid(False, which="both")
+            return
         self.ax.grid(
-            visible,
+            True,
             which="major",
             linestyle="--",
             linewidth=self.style.major_grid_width,
@@ -237,7 +285,7 @@ class PhasorManager:
             alpha=0.9,
         )
         self.ax.grid(
-            visible,
+            True,
             which="minor",
             linestyle=":",
             linewidth=self.style.minor_grid_width,
@@ -332,9 +380,90 @@ class PhasorManager:
         )
 
         self.phasors[phasor.name] = phasor
-        self.render()
+        self._include_extents(phasor)
+        self._request_render()
         return phasor
 
+    def draw_phasors(self, specs: Iterable[Mapping[str, Any]]) -> list[Phasor]:
+        """Draw several phasors and redraw the diagram once.
+
+        Each spec is a mapping of :meth:`draw_phasor` keyword arguments and must
+        include ``name``. Specs are applied in order, so a later spec can use
+        ``start_ref`` to start from a phasor drawn earlier in the same batch.
+
+        Args:
+            specs: Phasor definitions in drawing order.
+
+        Returns:
+            The stored phasors in the same order as ``specs``.
+
+        Raises:
+            ValueError: If any phasor definition is incomplete or invalid. Phasors
+                added by this call are removed again before the error is raised.
+        """
+
+        drawn: list[Phasor] = []
+        with self.deferred_render():
+            try:
+                for spec in specs:
+                    drawn.append(self.draw_phasor(**spec))
+            except Exception:
+                for phasor in drawn:
+                    del self.phasors[phasor.name]
+                self._recompute_extents()
+                raise
+        return drawn
+
+    def draw_chain(
+        self,
+        specs: Iterable[Mapping[str, Any]],
+        *,
+        start_ref: str = "abs",
+        start_x: float = 0.0,
+        start_y: float = 0.0,
+        ref_point: ReferencePoint = "end",
+    ) -> list[Phasor]:
+        """Draw phasors head to tail and redraw the diagram once.
+
+        The first phasor starts like :meth:`draw_phasor` does from ``start_ref``,
+        ``start_x``, ``start_y``, and ``ref_point``. Every following phasor starts
+        at the end of the previous one.
+
+        Args:
+            specs: :meth:`draw_phasor` keyword mappings in chain order. Each must
+                include ``name`` and must not set its own start point.
+            start_ref: ``"abs"`` for coordinates, or another phasor name.
+            start_x: Absolute start x-coordinate of the first phasor.
+            start_y: Absolute start y-coordinate of the first phasor.
+            ref_point: Referenced phasor point for the first phasor.
+
+        Returns:
+            The stored phasors in chain order.
+
+        Raises:
+            ValueError: If a spec sets a start point or any phasor definition is
+                invalid.
+        """
+
+        start: dict[str, Any] = {
+            "start_ref": start_ref,
+            "start_x": start_x,
+            "start_y": start_y,
+            "ref_point": ref_point,
+        }
+        chained: list[dict[str, Any]] = []
+        for spec in specs:
+            if "name" not in spec:
+                raise ValueError("Each chain spec must include a name.")
+            if _START_KEYS & spec.keys():
+                raise ValueError(
+                    "Chain specs must not set start_ref, start_x, start_y, "
+                    "or ref_point."
+                )
+            chained.append({**spec, **start})
+            start = {"start_ref": _validate_name(spec["name"]), "ref_point": "end"}
+        return self.draw_phasors(chained)
+
     def draw_complex(
         self,
         name: str,
@@ -547,27 +676,25 @@ class PhasorManager:
         if len(colors) != 3:
             raise ValueError("colors must contain exactly three values.")
 
-        phasors: list[Phasor] = []
-        for phase_name, phase_label, phase_angle, phase_color in zip(
-            phase_names,
-            phase_labels,
-            phase_angles,
-            colors,
-            strict=True,
-        ):
-            phasors.append(
-                self.draw_phasor(
-                    phase_name,
-                    magnitude=magnitude,
-                    angle=phase_angle,
-                    phasor_type=phasor_type,
-                    color=phase_color,
-                    label=phase_label,
-                    label_offset=label_offset,
-                    metadata=metadata,
-                )
+        return self.draw_phasors(
+            {
+                "name": phase_name,
+                "magnitude": magnitude,
+                "angle": phase_angle,
+                "phasor_type": phasor_type,
+                "color": phase_color,
+                "label": phase_label,
+                "label_offset": label_offset,
+                "metadata": metadata,
+            }
+            for phase_name, phase_label, phase_angle, phase_color in zip(
+                phase_names,
+                phase_labels,
+                phase_angles,
+                colors,
+                strict=True,
             )
-        return phasors
+        )
 
     def get_phasor(self, name: str) -> Phasor | None:
         """Return a phasor by name, or ``None`` if it does not exist."""
@@ -595,12 +722,13 @@ class PhasorManager:
 
         phasor = self._require_phasor(name)
         del self.phasors[name]
+        self._recompute_extents()
         self._angle_annotations = [
             annotation
             for annotation in self._angle_annotations
             if name not in {annotation.from_phasor, annotation.to_phasor}
         ]
-        self.render()
+        self._request_render()
         return phasor
 
     def add_angle_marker(
@@ -641,26 +769,26 @@ class PhasorManager:
             alpha=_coerce_unit_interval(alpha, "alpha"),
         )
         self._angle_annotations.append(annotation)
-        self.render()
+        self._request_render()
         return annotation
 
     def clear_annotations(self) -> None:
         """Remove angle markers and redraw the diagram."""
 
         self._angle_annotations.clear()
-        self.render()
+        self._request_render()
 
     def add_legend(self, location: str = "best") -> None:
         """Enable a compact legend using current phasor colors and labels."""
 
         self._legend_location = location
-        self.render()
+        self._request_render()
 
     def hide_legend(self) -> None:
         """Disable the legend and redraw the diagram."""
 
         self._legend_location = None
-        self.render()
+        self._request_render()
 
     def to_records(self) -> list[dict[str, float | str]]:
         """Return tabular phasor data suitable for export."""
@@ -709,26 +837,84 @@ class PhasorManager:
             writer.writerows(records)
         return output_path
 
+    def load_csv(self, filename: str | Path) -> list[Phasor]:
+        """Draw phasors from a CSV file and redraw the diagram once.
+
+        The file needs a ``name`` column plus either ``end_x``/``end_y`` or
+        ``magnitude``/``angle_deg`` columns. ``start_x``, ``start_y``, ``type``,
+        and ``label`` columns are optional, so files written by
+        :meth:`save_csv` load back unchanged.
+
+        Args:
+            filename: CSV file to read.
+
+        Returns:
+            The stored phasors in file order.
+
+        Raises:
+            ValueError: If any row defines an invalid phasor. No phasors from
+                the file are kept in that case.
+        """
+
+        with Path(filename).open("r", newline="", encoding="utf-8") as file:
+            specs = [_csv_row_spec(row) for row in csv.DictReader(file)]
+        return self.draw_phasors(specs)
+
     def clear(self) -> None:
         """Clear all phasors and reset the plot."""
 
         self.phasors.clear()
+        self._extents = _ORIGIN_EXTENTS
         self._angle_annotations.clear()
         self._legend_location = None
-        self.render()
+        self._request_render()
+
+    @contextmanager
+    def deferred_render(self) -> Iterator[PhasorManager]:
+        """Postpone redraws until the block exits, then redraw once.
+
+        Drawing, removal, marker, and legend calls normally redraw the whole
+        diagram. Inside this block they only update stored data. Blocks may be
+        nested; the redraw happens when the outermost block exits.
+
+        Yields:
+            This manager.
+        """
+
+        self._render_depth += 1
+        try:
+            yield self
+        finally:
+            self._render_depth -= 1
+            if self._render_depth == 0:
+                self._flush_render()
 
     def render(self) -> None:
         """Redraw the full diagram from stored phasor data."""
 
-        self.ax.cla()
-        self.setup_plot()
+        from matplotlib.font_manager import FontProperties
+
+        self._render_pending = False
+        self._remove_artists(self._artists)
+        self._artists.clear()
+        if not self._owns_axis_lines():
+            # The axes were cleared outside the manager.
+            self.setup_plot()
+        self._apply_style()
+        # The phasors dict is public, so rebuild extents it may have outgrown.
+        self._recompute_extents()
         self.fit()
+        span = self._data_span()
+        font = FontProperties(
+            size=self.style.label_font_size,
+            weight=self.style.label_font_weight,
+        )
         for phasor in self.phasors.values():
             self._draw_arrow(phasor)
         for annotation in self._angle_annotations:
-            self._draw_angle_marker(annotation)
+            self._draw_angle_marker(annotation, span, font)
         for phasor in self.phasors.values():
-            self._draw_label(phasor)
+            self._draw_label(phasor, span, font)
         self._draw_legend()
 
     def fit(self, margin: float = 0.15, equal_aspect: bool = True) -> None:
@@ -745,12 +931,12 @@ class PhasorManager:
 
         x_min, x_max, y_min, y_max = self._data_limits(margin)
         if equal_aspect:
-            x_min, x_max, y_min, y_max = _match_figure_aspect(
+            x_min, x_max, y_min, y_max = _match_aspect(
                 x_min,
                 x_max,
                 y_min,
                 y_max,
-                self.fig,
+                *self._plot_size(),
             )
             self.ax.set_aspect("equal", adjustable="box")
         else:
@@ -765,10 +951,25 @@ class PhasorManager:
         equal_aspect: bool = True,
         margin: float = 0.15,
     ) -> None:
-        """Display the diagram."""
+        """Display the diagram.
 
+        Raises:
+            RuntimeError: If the figure is not managed by pyplot, such as for a
+                headless manager or axes from a ``Figure`` created directly.
+        """
+
+        if self.fig.canvas.manager is None:
+            raise RuntimeError(
+                "This diagram is not attached to a pyplot window; "
+                "use save() or to_array() instead."
+            )
+
+        self._flush_render()
         self.fit(margin=margin, equal_aspect=equal_aspect)
         self._apply_grid(grid)
+
+        import matplotlib.pyplot as plt
+
         plt.show()
 
     def save(
@@ -780,15 +981,89 @@ class PhasorManager:
         equal_aspect: bool = True,
         margin: float = 0.15,
     ) -> Path:
-        """Save the current diagram and return the output path."""
+        """Save the current diagram and return the output path.
+
+        The format follows the file extension. Vector formats such as ``.svg``
+        and ``.pdf`` are written without rasterizing, so ``dpi`` only affects
+        raster formats such as ``.png``.
+        """
 
         output_path = Path(filename)
         output_path.parent.mkdir(parents=True, exist_ok=True)
+        self._flush_render()
         self.fit(margin=margin, equal_aspect=equal_aspect)
         self._apply_grid(grid)
         self.fig.savefig(output_path, bbox_inches="tight", dpi=dpi)
         return output_path
 
+    def to_array(
+        self,
+        *,
+        grid: bool = True,
+        equal_aspect: bool = True,
+        margin: float = 0.15,
+    ) -> NDArray[np.uint8]:
+        """Render the diagram and return its pixels as an RGBA array.
+
+        This skips the image encoding and file I/O of :meth:`save` for
+        pipelines that consume pixels directly. The array covers the full
+        figure at the figure DPI and has shape ``(height, width, 4)``.
+        Figures whose canvas cannot render pixels, such as a plain
+        ``Figure`` or a vector backend, are drawn on a temporary Agg canvas.
+        """
+
+        import numpy as np
+
+        self._flush_render()
+        self.fit(margin=margin, equal_aspect=equal_aspect)
+        self._apply_grid(grid)
+        canvas = self.fig.canvas
+        if hasattr(canvas, "buffer_rgba"):
+            canvas.draw()
+            return np.array(canvas.buffer_rgba())
+
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+        agg_canvas = FigureCanvasAgg(self.fig)
+        try:
+            agg_canvas.draw()
+            return np.array(agg_canvas.buffer_rgba())
+        finally:
+            self.fig.set_canvas(canvas)
+
+    def _plot_size(self) -> tuple[float, float]:
+        if not self._external_axes:
+            width, height = self.fig.get_size_inches()
+            return width, height
+        # An external axes may be one panel of a larger figure, so use its
+        # own box. The original position ignores aspect shrinking on draw.
+        box = self.ax.get_position(original=True)
+        box = box.transformed(self.ax.figure.transSubfigure)
+        return box.width, box.height
+
+    def _grid_shown(self) -> bool:
+        return any(line.get_visible() for line in self.ax.xaxis.get_gridlines())
+
+    def _remove_artists(self, artists: Iterable[Artist]) -> None:
+        # Skip artists already removed, for example by ``ax.cla()``.
+        children = set(self.ax.get_children())
+        for artist in artists:
+            if artist in children:
+                artist.remove()
+
+    def _owns_axis_lines(self) -> bool:
+        children = set(self.ax.get_children())
+        return all(line in children for line in self._axis_lines)
+
+    def _request_render(self) -> None:
+        self._render_pending = True
+        if self._render_depth == 0:
+            self.render()
+
+    def _flush_render(self) -> None:
+        if self._render_pending:
+            self.render()
+
     def _resolve_start(
         self,
         start_ref: str,
@@ -818,15 +1093,27 @@ class PhasorManager:
         except KeyError as exc:
             raise ValueError(f"Phasor '{name}' does not exist.") from exc
 
-    def _data_limits(self, margin: float = 0.15) -> tuple[float, float, float, float]:
-        points = [(0.0, 0.0)]
+    def _include_extents(self, phasor: Phasor) -> None:
+        x_min, x_max, y_min, y_max = self._extents
+        self._extents = (
+            min(x_min, phasor.start_x, phasor.end_x),
+            max(x_max, phasor.start_x, phasor.end_x),
+            min(y_min, phasor.start_y, phasor.end_y),
+            max(y_max, phasor.start_y, phasor.end_y),
+        )
+
+    def _recompute_extents(self) -> None:
+        x_values = [0.0]
+        y_values = [0.0]
         for phasor in self.phasors.values():
-            points.extend([phasor.start, phasor.end])
+            x_values += (phasor.start_x, phasor.end_x)
+            y_values += (phasor.start_y, phasor.end_y)
+        self._extents = (min(x_values), max(x_values), min(y_values), max(y_values))
 
-        x_values = [point[0] for point in points]
-        y_values = [point[1] for point in points]
-        x_min, x_max = _expand_limits(min(x_values), max(x_values), margin)
-        y_min, y_max = _expand_limits(min(y_values), max(y_values), margin)
+    def _data_limits(self, margin: float = 0.15) -> tuple[float, float, float, float]:
+        x_min, x_max, y_min, y_max = self._extents
+        x_min, x_max = _expand_limits(x_min, x_max, margin)
+        y_min, y_max = _expand_limits(y_min, y_max, margin)
         return x_min, x_max, y_min, y_max
 
     def _data_span(self) -> float:
@@ -834,28 +1121,33 @@ class PhasorManager:
         return max(x_max - x_min, y_max - y_min, 1.0)
 
     def _draw_arrow(self, phasor: Phasor) -> None:
+        from matplotlib.patches import FancyArrowPatch
+
         line_width = phasor.line_width or self.style.arrow_line_width
-        self.ax.annotate(
-            "",
-            xy=phasor.end,
-            xytext=phasor.start,
-            arrowprops={
-                "arrowstyle": "-|>",
-                "color": phasor.color,
-                "linewidth": line_width,
-                "linestyle": phasor.linestyle,
-                "mutation_scale": self.style.arrow_head_size,
-                "shrinkA": 0,
-                "shrinkB": 0,
-                "alpha": phasor.alpha,
-                "capstyle": "round",
-                "joinstyle": "miter",
-            },
+        arrow = FancyArrowPatch(
+            phasor.start,
+            phasor.end,
+            arrowstyle="-|>",
+            color=phasor.color,
+            linewidth=line_width,
+            linestyle=phasor.linestyle,
+            mutation_scale=self.style.arrow_head_size,
+            shrinkA=0,
+            shrinkB=0,
+            alpha=phasor.alpha,
+            capstyle="round",
+            joinstyle="miter",
             zorder=3,
         )
+        self._artists.append(self.ax.add_patch(arrow))
 
-    def _draw_label(self, phasor: Phasor) -> None:
-        label_x, label_y = self._label_position(phasor)
+    def _draw_label(
+        self,
+        phasor: Phasor,
+        span: float,
+        font: FontProperties,
+    ) -> None:
+        label_x, label_y = self._label_position(phasor, span)
         label_box = None
         if self.style.label_box:
             label_box = {
@@ -865,53 +1157,57 @@ class PhasorManager:
                 "alpha": self.style.label_box_alpha,
             }
 
-        self.ax.text(
+        text = self.ax.text(
             label_x,
             label_y,
             phasor.label or phasor.name,
             color=phasor.color,
-            fontsize=self.style.label_font_size,
-            fontweight=self.style.label_font_weight,
+            fontproperties=font,
             ha="center",
             va="center",
             alpha=phasor.alpha,
             bbox=label_box,
             zorder=4,
         )
+        self._artists.append(text)
+
+    def _draw_angle_marker(
+        self,
+        annotation: AngleAnnotation,
+        span: float,
+        font: FontProperties,
+    ) -> None:
+        from matplotlib.patches import Arc
 
-    def _draw_angle_marker(self, annotation: AngleAnnotation) -> None:
         from_phasor = self._require_phasor(annotation.from_phasor)
         to_phasor = self._require_phasor(annotation.to_phasor)
         angle_from = from_phasor.angle_deg
         delta = _smallest_angle_delta(angle_from, to_phasor.angle_deg)
         theta1 = angle_from if delta >= 0 else angle_from + delta
         theta2 = angle_from + delta if delta >= 0 else angle_from
-        radius = annotation.radius or self._data_span() * 0.16
-
-        self.ax.add_patch(
-            Arc(
-                (0.0, 0.0),
-                width=2.0 * radius,
-                height=2.0 * radius,
-                theta1=theta1,
-                theta2=theta2,
-                color=annotation.color,
-                linewidth=annotation.line_width,
-                alpha=annotation.alpha,
-                zorder=2,
-            )
+        radius = annotation.radius or span * 0.16
+
+        arc = Arc(
+            (0.0, 0.0),
+            width=2.0 * radius,
+            height=2.0 * radius,
+            theta1=theta1,
+            theta2=theta2,
+            color=annotation.color,
+            linewidth=annotation.line_width,
+            alpha=annotation.alpha,
+            zorder=2,
         )
+        self._artists.append(self.ax.add_patch(arc))
 
-        label_angle = math.radians(angle_from + delta / 2.0)
-        label_radius = radius * 1.18
+        label_position = _rect(radius * 1.18, angle_from + delta / 2.0)
         label = annotation.label or rf"${abs(delta):.1f}^\circ$"
-        self.ax.text(
-            label_radius * math.cos(label_angle),
-            label_radius * math.sin(label_angle),
+        text = self.ax.text(
+            label_position.real,
+            label_position.imag,
             label,
             color=annotation.color,
-            fontsize=self.style.label_font_size,
-            fontweight=self.style.label_font_weight,
+            fontproperties=font,
             ha="center",
             va="center",
             alpha=annotation.alpha,
@@ -923,11 +1219,14 @@ class PhasorManager:
             },
             zorder=4,
         )
+        self._artists.append(text)
 
     def _draw_legend(self) -> None:
         if not self._legend_location or not self.phasors:
             return
 
+        from matplotlib.lines import Line2D
+
         handles = [
             Line2D(
                 [0],
@@ -939,27 +1238,34 @@ class PhasorManager:
             )
             for phasor in self.phasors.values()
         ]
-        self.ax.legend(handles=handles, loc=self._legend_location, framealpha=0.92)
+        legend = self.ax.legend(
+            handles=handles,
+            loc=self._legend_location,
+            framealpha=0.92,
+        )
+        self._artists.append(legend)
 
-    def _label_position(self, phasor: Phasor) -> tuple[float, float]:
-        mid_x = phasor.start_x + phasor.dx / 2.0
-        mid_y = phasor.start_y + phasor.dy / 2.0
+    def _label_position(self, phasor: Phasor, span: float) -> tuple[float, float]:
+        dx, dy = phasor.dx, phasor.dy
+        mid_x = phasor.start_x + dx / 2.0
+        mid_y = phasor.start_y + dy / 2.0
 
         offset = phasor.label_offset
         if offset is not None:
             offset_x, offset_y = _coerce_label_offset(offset)
             return mid_x + offset_x, mid_y + offset_y
 
-        if phasor.magnitude == 0:
+        magnitude = phasor.magnitude
+        if magnitude == 0:
             return mid_x, mid_y
 
-        normal_x = -phasor.dy / phasor.magnitude
-        normal_y = phasor.dx / phasor.magnitude
+        normal_x = -dy / magnitude
+        normal_y = dx / magnitude
         if normal_y < 0:
             normal_x *= -1.0
             normal_y *= -1.0
 
-        offset_size = self._data_span() * self.style.auto_label_offset_fraction
+        offset_size = span * self.style.auto_label_offset_fraction
         return mid_x + normal_x * offset_size, mid_y + normal_y * offset_size
 
 
@@ -977,8 +1283,7 @@ def polar(magnitude: float, angle: float) -> complex:
     if magnitude < 0:
         raise ValueError("magnitude must be greater than or equal to 0.")
 
-    angle_rad = math.radians(_coerce_float(angle, "angle"))
-    return complex(magnitude * math.cos(angle_rad), magnitude * math.sin(angle_rad))
+    return _rect(magnitude, _coerce_float(angle, "angle"))
 
 
 def to_polar(value: complex) -> tuple[float, float]:
@@ -1040,6 +1345,25 @@ def phase_components(
     return phase_a, phase_b, phase_c
 
 
+def _csv_row_spec(row: Mapping[str, str | None]) -> dict[str, Any]:
+    values = {key: value for key, value in row.items() if value}
+    spec: dict[str, Any] = {
+        "name": values.get("name", ""),
+        "phasor_type": values.get("type", "voltage"),
+    }
+    for column in ("start_x", "start_y", "label"):
+        if column in values:
+            spec[column] = values[column]
+
+    if "end_x" in values or "end_y" in values:
+        spec["end_x"] = values.get("end_x")
+        spec["end_y"] = values.get("end_y")
+    else:
+        spec["magnitude"] = values.get("magnitude")
+        spec["angle"] = values.get("angle_deg")
+    return spec
+
+
 def _normalize_phasor_type(phasor_type: str) -> str:
     normalized = str(phasor_type).strip().lower()
     if not normalized:
@@ -1072,11 +1396,25 @@ def _resolve_end(
     if phasor_magnitude < 0:
         raise ValueError("magnitude must be greater than or equal to 0.")
 
-    angle_rad = math.radians(_coerce_float(angle, "angle"))
-    return (
-        start[0] + phasor_magnitude * math.cos(angle_rad),
-        start[1] + phasor_magnitude * math.sin(angle_rad),
-    )
+    value = _rect(phasor_magnitude, _coerce_float(angle, "angle"))
+    return start[0] + value.real, start[1] + value.imag
+
+
+def _rect(magnitude: float, angle: float) -> complex:
+    """Return ``magnitude`` at ``angle`` degrees as a complex number."""
+
+    return magnitude * _unit_phasor(angle)
+
+
+@lru_cache(maxsize=4096)
+def _unit_phasor(angle: float) -> complex:
+    """Return the unit phasor at ``angle`` degrees.
+
+    Diagrams reuse a small set of angles, such as the 120 degree steps of
+    three-phase sets, so the trigonometry is cached per angle.
+    """
+
+    return cmath.rect(1.0, math.radians(angle))
 
 
 def _phase_angles(
@@ -1180,14 +1518,14 @@ def _expand_limits(
     return center - padded_span / 2.0, center + padded_span / 2.0
 
 
-def _match_figure_aspect(
+def _match_aspect(
     x_min: float,
     x_max: float,
     y_min: float,
     y_max: float,
-    fig: Figure,
+    width: float,
+    height: float,
 ) -> tuple[float, float, float, float]:
-    width, height = fig.get_size_inches()
     if width <= 0 or height <= 0:
         return x_min, x_max, y_min, y_max
 
@@ -1,8 +1,11 @@
 import csv
 import math
+import subprocess
+import sys
 from contextlib import suppress
 from pathlib import Path
 
+import matplotlib.pyplot as plt
 import pytest
 
 from PSPhasor import (
@@ -46,6 +49,122 @@ def test_reference_phasor_end_point() -> None:
     assert drop.end == pytest.approx((8, 0))
 
 
+def test_draw_phasors_resolves_references_within_batch() -> None:
+    manager = PhasorManager()
+
+    phasors = manager.draw_phasors(
+        [
+            {"name": "Vs", "magnitude": 10, "angle": 0},
+            {"name": "Vl", "magnitude": 2, "angle": 180, "start_ref": "Vs"},
+            {"name": "I", "magnitude": 4, "angle": -30, "phasor_type": "current"},
+        ]
+    )
+
+    assert [phasor.name for phasor in phasors] == ["Vs", "Vl", "I"]
+    assert phasors[1].start == pytest.approx((10, 0))
+    assert phasors[1].end == pytest.approx((8, 0))
+    assert manager.get_phasor("I") is phasors[2]
+
+
+def test_draw_phasors_rolls_back_on_invalid_spec() -> None:
+    manager = PhasorManager()
+    manager.draw_phasor("Vs", magnitude=10, angle=0)
+
+    with pytest.raises(ValueError, match="magnitude"):
+        manager.draw_phasors(
+            [
+                {"name": "Va", "magnitude": 1, "angle": 0},
+                {"name": "Vb", "magnitude": -1, "angle": 120},
+            ]
+        )
+
+    assert list(manager.phasors) == ["Vs"]
+
+
+def test_draw_chain_places_phasors_head_to_tail() -> None:
+    manager = PhasorManager()
+
+    chain = manager.draw_chain(
+        [
+            {"name": "Vr", "magnitude": 10, "angle": 0},
+            {"name": "IR", "magnitude": 1, "angle": -30},
+            {"name": "IX", "magnitude": 2, "angle": 60},
+        ],
+        start_x=1,
+    )
+
+    assert chain[0].start == pytest.approx((1, 0))
+    assert chain[1].start == pytest.approx(chain[0].end)
+    assert chain[2].start == pytest.approx(chain[1].end)
+    expected_end = 1 + polar(10, 0) + polar(1, -30) + polar(2, 60)
+    assert complex(*chain[2].end) == pytest.approx(expected_end)
+
+
+def test_draw_chain_rejects_spec_start_points() -> None:
+    manager = PhasorManager()
+
+    with pytest.raises(ValueError, match="must not set"):
+        manager.draw_chain([{"name": "V", "magnitude": 1, "angle": 0, "start_x": 2}])
+
+
+def test_manager_draws_on_existing_axes() -> None:
+    fig, (left, right) = plt.subplots(1, 2)
+
+    try:
+        manager = PhasorManager(ax=right, title="Right panel")
+        manager.draw_phasor("Vs", magnitude=10, angle=0)
+
+        assert manager.fig is fig
+        assert manager.ax is right
+        assert right.get_title() == "Right panel"
+        assert not left.has_data()
+    finally:
+        plt.close(fig)
+
+
+def test_existing_axes_fit_matches_panel_aspect() -> None:
+    fig, (_, right) = plt.subplots(1, 2, figsize=(8, 4))
+
+    try:
+        manager = PhasorManager(ax=right)
+        manager.draw_phasor("Vs", magnitude=10, angle=0)
+
+        box = right.get_position(original=True)
+        x_min, x_max = right.get_xlim()
+        y_min, y_max = right.get_ylim()
+        assert (y_max - y_min) / (x_max - x_min) == pytest.approx(
+            (box.height * 4) / (box.width * 8)
+        )
+    finally:
+        plt.close(fig)
+
+
+def test_deferred_render_redraws_once_on_exit(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    manager = PhasorManager()
+    render = manager.render
+    calls = []
+
+    def counting_render() -> None:
+        calls.append(None)
+        render()
+
+    monkeypatch.setattr(manager, "render", counting_render)
+
+    with manager.deferred_render():
+        manager.draw_phasor("V", magnitude=1, angle=0)
+        with manager.deferred_render():
+            manager.draw_phasor("I", magnitude=1, angle=-30)
+        manager.add_angle_marker("V", "I")
+
+        assert not calls
+        assert not manager.ax.patches
+
+    assert len(calls) == 1
+    assert len(manager.ax.patches) == 3
+
+
 def test_explicit_cartesian_coordinates() -> None:
     manager = PhasorManager()
 
@@ -79,6 +198,14 @@ def test_polar_helpers_round_trip_complex_value() -> None:
     assert angle == pytest.approx(-30)
 
 
+def test_import_does_not_load_matplotlib() -> None:
+    code = "import sys, PSPhasor; sys.exit('matplotlib' in sys.modules)"
+
+    result = subprocess.run([sys.executable, "-c", code], check=False)
+
+    assert result.returncode == 0
+
+
 def test_symmetrical_components_round_trip_phase_values() -> None:
     phase_values = (
         7.3 - 0.1j,
@@ -105,6 +232,16 @@ def test_draw_three_phase_positive_sequence() -> None:
     assert phases[2].angle_deg == pytest.approx(120)
 
 
+def test_draw_three_phase_is_atomic() -> None:
+    manager = PhasorManager()
+    manager.draw_phasor("Vb", magnitude=1, angle=0)
+
+    with pytest.raises(ValueError, match="already exists"):
+        manager.draw_three_phase("V", magnitude=1, angle=0)
+
+    assert list(manager.phasors) == ["Vb"]
+
+
 def test_draw_line_to_line_voltage_from_phase_voltages() -> None:
     manager = PhasorManager()
     manager.draw_three_phase("V", magnitude=1, angle=0)
@@ -148,6 +285,98 @@ def test_angle_marker_is_stored_and_removed_with_phasor() -> None:
     assert len(manager.angle_annotations) == 0
 
 
+def test_fit_tracks_extents_after_removal() -> None:
+    manager = PhasorManager()
+    manager.draw_phasor("V", magnitude=2, angle=0)
+    manager.draw_phasor("I", magnitude=50, angle=180)
+
+    x_min, _ = manager.ax.get_xlim()
+    assert x_min < -50
+
+    manager.remove_phasor("I")
+
+    x_min, x_max = manager.ax.get_xlim()
+    assert -50 < x_min < 0
+    assert x_max > 2
+
+
+def test_render_rebuilds_extents_from_stored_phasors() -> None:
+    manager = PhasorManager()
+    manager.draw_phasor("A", magnitude=100, angle=0)
+    manager.draw_phasor("B", magnitude=1, angle=0)
+
+    del manager.phasors["A"]
+    manager.render()
+
+    assert manager.ax.get_xlim()[1] < 10
+
+
+def test_render_replaces_only_diagram_artists() -> None:
+    manager = PhasorManager()
+    manager.draw_phasor("V", magnitude=1, angle=0)
+    (note,) = manager.ax.plot([0, 1], [1, 1])
+    patch_count = len(manager.ax.patches)
+
+    manager.draw_phasor("I", magnitude=1, angle=-30)
+
+    assert note in manager.ax.lines
+    assert len(manager.ax.patches) == patch_count + 1
+
+    manager.clear()
+
+    assert note in manager.ax.lines
+    assert not manager.ax.patches
+    assert not manager.ax.texts
+
+
+def test_render_recovers_after_axes_are_cleared() -> None:
+    manager = PhasorManager()
+    manager.draw_phasor("V", magnitude=1, angle=0)
+    manager.ax.texts[0].remove()
+    manager.draw_phasor("I", magnitude=1, angle=90)
+
+    manager.ax.cla()
+    manager.draw_phasor("Z", magnitude=1, angle=45)
+
+    assert len(manager.ax.patches) == 3
+    assert len(manager.ax.lines) == 2
+    assert manager.ax.get_title() == "Phasor Diagram"
+    assert all(line.get_visible() for line in manager.ax.xaxis.get_gridlines())
+
+    manager.ax.cla()
+    manager.clear()
+
+    assert not manager.ax.patches
+    assert len(manager.ax.lines) == 2
+
+
+def test_render_applies_updated_title_and_style() -> None:
+    manager = PhasorManager()
+    manager.title = "Changed"
+    manager.style = DiagramStyle(background_color="black", axis_color="red")
+
+    manager.draw_phasor("V", magnitude=1, angle=0)
+
+    assert manager.ax.get_title() == "Changed"
+    assert manager.ax.get_facecolor() == (0.0, 0.0, 0.0, 1.0)
+    assert all(line.get_color() == "red" for line in manager.ax.lines)
+
+
+def test_render_restyles_grid_and_keeps_visibility() -> None:
+    manager = PhasorManager()
+    manager.style = DiagramStyle(major_grid_color="red")
+
+    manager.draw_phasor("V", magnitude=1, angle=0)
+
+    gridlines = manager.ax.xaxis.get_gridlines()
+    assert all(line.get_color() == "red" for line in gridlines)
+
+    manager.to_array(grid=False)
+    manager.draw_phasor("I", magnitude=1, angle=-30)
+
+    assert not any(line.get_visible() for line in manager.ax.xaxis.get_gridlines())
+
+
 def test_remove_unknown_phasor_raises_value_error() -> None:
     manager = PhasorManager()
 
@@ -217,6 +446,76 @@ def test_save_returns_output_path() -> None:
             output.parent.rmdir()
 
 
+def test_to_array_returns_rgba_pixels() -> None:
+    manager = PhasorManager(figsize=(4, 3))
+    manager.draw_phasor("Vs", magnitude=10, angle=0)
+
+    pixels = manager.to_array()
+
+    width, height = manager.fig.canvas.get_width_height()
+    assert pixels.shape == (height, width, 4)
+    assert pixels.dtype.name == "uint8"
+    assert (pixels[..., :3] < 255).any()
+
+
+def test_unmanaged_figure_falls_back_to_to_array() -> None:
+    from matplotlib.figure import Figure
+
+    figure = Figure(figsize=(4, 3))
+    canvas = figure.canvas
+    manager = PhasorManager(ax=figure.subplots())
+    manager.draw_phasor("Vs", magnitude=10, angle=0)
+
+    with pytest.raises(RuntimeError, match="to_array"):
+        manager.show()
+    pixels = manager.to_array()
+
+    assert pixels.shape == (300, 400, 4)
+    assert figure.canvas is canvas
+
+
+def test_output_applies_requested_grid_after_external_change() -> None:
+    manager = PhasorManager()
+    manager.draw_phasor("Vs", magnitude=10, angle=0)
+    output = Path("tests/test-output/grid.png")
+
+    try:
+        manager.ax.grid(False, which="both")
+        manager.to_array()
+
+        assert all(line.get_visible() for line in manager.ax.xaxis.get_gridlines())
+
+        manager.ax.grid(False, which="both")
+        manager.save(output)
+
+        assert all(line.get_visible() for line in manager.ax.xaxis.get_gridlines())
+    finally:
+        with suppress(FileNotFoundError):
+            output.unlink()
+        with suppress(OSError):
+            output.parent.rmdir()
+
+
+def test_headless_manager_bypasses_pyplot() -> None:
+    open_figures = plt.get_fignums()
+    manager = PhasorManager(headless=True)
+    manager.draw_phasor("Vs", magnitude=10, angle=0)
+    output = Path("tests/test-output/headless.png")
+
+    try:
+        manager.save(output)
+
+        assert plt.get_fignums() == open_figures
+        assert output.stat().st_size > 0
+        with pytest.raises(RuntimeError, match="not attached"):
+            manager.show()
+    finally:
+        with suppress(FileNotFoundError):
+            output.unlink()
+        with suppress(OSError):
+            output.parent.rmdir()
+
+
 def test_save_csv_exports_engineering_records() -> None:
     manager = PhasorManager()
     manager.draw_phasor("Vs", magnitude=10, angle=0, label=r"$V_s$")
@@ -238,3 +537,50 @@ def test_save_csv_exports_engineering_records() -> None:
             output.unlink()
         with suppress(OSError):
             output.parent.rmdir()
+
+
+def test_load_csv_round_trips_saved_records() -> None:
+    manager = PhasorManager()
+    manager.draw_phasor("Vs", magnitude=10, angle=0, label=r"$V_s$")
+    manager.draw_phasor(
+        "I",
+        magnitude=4,
+        angle=-30,
+        start_ref="Vs",
+        phasor_type="current",
+    )
+    output = Path("tests/test-output/round_trip.csv")
+
+    try:
+        manager.save_csv(output)
+        loaded = PhasorManager().load_csv(output)
+
+        assert [phasor.name for phasor in loaded] == ["Vs", "I"]
+        assert loaded[0].label == r"$V_s$"
+        assert loaded[1].phasor_type == "current"
+        assert loaded[1].start == pytest.approx((10, 0))
+        assert loaded[1].magnitude == pytest.approx(4)
+        assert loaded[1].angle_deg == pytest.approx(-30)
+    finally:
+        with suppress(FileNotFoundError):
+            output.unlink()
+        with suppress(OSError):
+            output.parent.rmdir()
+
+
+def test_load_csv_accepts_polar_columns() -> None:
+    output = Path("tests/test-output/polar.csv")
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text("name,magnitude,angle_deg\nVa,1,0\nVb,1,-120\n")
+
+    try:
+        loaded = PhasorManager().load_csv(output)
+
+        assert loaded[1].end == pytest.approx(
+            (math.cos(math.radians(-120)), math.sin(math.radians(-120)))
+        )
+    finally:
+        with suppress(FileNotFoundError):
+            output.unlink()
+        with suppress(OSError):
+            output.parent.rmdir()